@@ -8,6 +8,7 @@ from .controller import TuxedoController
 from .effects.basic import BasicEffects
 from .effects.rainbow import RainbowEffects
 from .effects.schemes import ColorSchemes
+from .effects.zones import ZoneEffects
 
 
 def parse_color(color_str):
@@ -21,6 +22,43 @@ def parse_color(color_str):
         raise argparse.ArgumentTypeError(f"Invalid color format: {e}")
 
 
+def parse_zone_effect(spec_str):
+    """Parse zone effect string in format 'EFFECT[:ARG]' to tuple (effect, arg)
+
+    solid and breathing take an R,G,B color, color-cycle takes a scheme name
+    and rainbow takes an optional starting hue (0.0-1.0).
+    """
+    effect, _, arg = spec_str.partition(':')
+    if effect not in ZoneEffects.EFFECTS:
+        raise argparse.ArgumentTypeError(
+            f"Unknown zone effect: {effect}. "
+            f"Available effects: {', '.join(ZoneEffects.EFFECTS)}"
+        )
+
+    if effect in ('solid', 'breathing'):
+        return (effect, parse_color(arg))
+    if effect == 'color-cycle':
+        scheme = arg or 'sunset'
+        if scheme not in ColorSchemes.SCHEMES:
+            raise argparse.ArgumentTypeError(f"Unknown color scheme: {scheme}")
+        return (effect, scheme)
+    try:
+        return (effect, float(arg) if arg else 0.0)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"Invalid rainbow hue offset: {arg}")
+
+
+def build_zone_effect(effect, arg, duration):
+    """Create a zone effect from a parsed (effect, arg) pair"""
+    if effect == 'solid':
+        return ZoneEffects.solid(arg)
+    if effect == 'breathing':
+        return ZoneEffects.breathing(arg, duration=duration)
+    if effect == 'color-cycle':
+        return ZoneEffects.color_cycle(scheme=arg, duration=duration)
+    return ZoneEffects.rainbow(duration=duration, offset=arg)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Control Tuxedo RGB keyboard from command line"
@@ -77,6 +115,34 @@ def main():
         help='Duration of one cycle in seconds (default: 5.0)'
     )
 
+    # Per-zone effects command
+    zones_parser = subparsers.add_parser(
+        'zones',
+        help='Run a different effect on each zone',
+        description='Run a different effect on each zone in a single render loop. '
+                    'Effects: solid:R,G,B, breathing:R,G,B, color-cycle[:SCHEME], '
+                    'rainbow[:HUE]. Zones without an effect are left unchanged.'
+    )
+    for zone in ('left', 'center', 'right'):
+        zones_parser.add_argument(
+            f'--{zone}',
+            type=parse_zone_effect,
+            metavar='EFFECT[:ARG]',
+            help=f'Effect for the {zone} zone (e.g., breathing:255,0,0)'
+        )
+    zones_parser.add_argument(
+        '--duration',
+        type=float,
+        default=5.0,
+        help='Duration of one effect cycle in seconds (default: 5.0)'
+    )
+    zones_parser.add_argument(
+        '--fps',
+        type=float,
+        default=30.0,
+        help='Frames rendered per second (default: 30.0)'
+    )
+
     # List schemes command
     subparsers.add_parser('list-schemes', help='List available color schemes')
 
@@ -89,6 +155,15 @@ def main():
         parser.print_help()
         return 1
 
+    if args.command == 'zones':
+        zone_specs = {
+            zone: getattr(args, zone)
+            for zone in ('left', 'center', 'right')
+            if getattr(args, zone) is not None
+        }
+        if not zone_specs:
+            zones_parser.error("assign an effect to at least one of --left, --center, --right")
+
     # Handle list-schemes without requiring controller
     if args.command == 'list-schemes':
         print("Available color schemes:")
@@ -101,6 +176,7 @@ def main():
         controller = TuxedoController()
         basic_effects = BasicEffects(controller)
         rainbow_effects = RainbowEffects(controller)
+        zone_effects = ZoneEffects(controller)
     except RuntimeError as e:
         print(f"Error: {e}", file=sys.stderr)
         print("\nNote: This tool requires:", file=sys.stderr)
@@ -133,6 +209,13 @@ def main():
             print("Press Ctrl+C to stop")
             rainbow_effects.color_cycle(scheme=args.scheme, duration=args.duration)
 
+        elif args.command == 'zones':
+            for zone, (effect, arg) in zone_specs.items():
+                print(f"Setting {zone} zone to {effect}")
+                zone_effects.assign(zone, build_zone_effect(effect, arg, args.duration))
+            print("Press Ctrl+C to stop")
+            zone_effects.run(fps=args.fps)
+
         elif args.command == 'reset':
             print("Resetting keyboard to white")
             controller.cleanup()
@@ -44,6 +44,23 @@ class TuxedoController:
         except (IOError, OSError) as e:
             raise RuntimeError(f"Failed to set color for {zone} zone: {e}")
 
+    def set_zone_colors(self, colors: Dict[str, Tuple[int, int, int]]) -> None:
+        """
+        Set RGB colors for several keyboard zones in one batch
+
+        All zones are validated before any color is written, so an invalid
+        zone name leaves the keyboard untouched.
+
+        Args:
+            colors: Mapping of zone name to (r, g, b) color values (0-255)
+        """
+        for zone in colors:
+            if zone not in self.zones:
+                raise ValueError(f"Invalid zone: {zone}")
+
+        for zone, (r, g, b) in colors.items():
+            self.set_zone_color(zone, r, g, b)
+
     def set_all_zones(self, r: int, g: int, b: int) -> None:
         """Set all keyboard zones to the same RGB color"""
         for zone in self.zones:
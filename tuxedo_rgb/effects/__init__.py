@@ -6,5 +6,6 @@ This module contains various RGB effects for Tuxedo keyboards.
 from .basic import BasicEffects
 from .rainbow import RainbowEffects
 from .schemes import ColorSchemes
+from .zones import ZoneEffects
 
-__all__ = ["BasicEffects", "RainbowEffects", "ColorSchemes"]
+__all__ = ["BasicEffects", "RainbowEffects", "ColorSchemes", "ZoneEffects"]
@@ -0,0 +1,138 @@
+# tuxedo_rgb/effects/zones.py
+
+import time
+import math
+import colorsys
+import threading
+from typing import Callable, Dict, Optional, Tuple
+from ..controller import TuxedoController
+from .schemes import ColorSchemes
+
+# A zone effect maps elapsed time in seconds to an RGB color (0-255)
+ZoneEffect = Callable[[float], Tuple[int, int, int]]
+
+
+class ZoneEffects:
+    """Run an independent effect on each keyboard zone in a single render loop"""
+
+    EFFECTS = ['solid', 'breathing', 'color-cycle', 'rainbow']
+
+    def __init__(self, controller: TuxedoController):
+        self.controller = controller
+        self.assignments: Dict[str, ZoneEffect] = {}
+
+    def assign(self, zone: str, effect: ZoneEffect) -> None:
+        """
+        Assign an effect to a keyboard zone
+
+        Args:
+            zone: Keyboard zone ('left', 'center', 'right')
+            effect: Zone effect, e.g. from ZoneEffects.breathing()
+        """
+        if zone not in self.controller.zones:
+            raise ValueError(f"Invalid zone: {zone}")
+        self.assignments[zone] = effect
+
+    def clear(self) -> None:
+        """Remove all zone assignments"""
+        self.assignments.clear()
+
+    def render(self, elapsed: float) -> Dict[str, Tuple[int, int, int]]:
+        """Compute the colors of all assigned zones for one frame"""
+        return {zone: effect(elapsed) for zone, effect in self.assignments.items()}
+
+    def run(self, fps: float = 30.0, stop_event: Optional[threading.Event] = None) -> None:
+        """
+        Render all assigned zone effects until interrupted
+
+        Every frame is committed to the keyboard as one batch, so all
+        zones advance together regardless of how many effects are running.
+
+        Args:
+            fps: Frames rendered per second
+            stop_event: Optional event that ends the loop when set
+        """
+        if not self.assignments:
+            raise ValueError("No zone effects assigned")
+
+        frame_time = 1.0 / fps
+        start = time.monotonic()
+
+        try:
+            while stop_event is None or not stop_event.is_set():
+                frame_start = time.monotonic()
+                self.controller.set_zone_colors(self.render(frame_start - start))
+
+                remaining = frame_time - (time.monotonic() - frame_start)
+                if stop_event is not None:
+                    stop_event.wait(max(remaining, 0))
+                elif remaining > 0:
+                    time.sleep(remaining)
+
+        except KeyboardInterrupt:
+            self.controller.cleanup()
+
+    @staticmethod
+    def solid(color: Tuple[int, int, int]) -> ZoneEffect:
+        """Create a zone effect that holds a single color"""
+        color = tuple(color)
+        return lambda elapsed: color
+
+    @staticmethod
+    def breathing(color: Tuple[int, int, int], duration: float = 3.0) -> ZoneEffect:
+        """
+        Create a zone effect that pulses a single color
+
+        Args:
+            color: RGB color tuple
+            duration: Time for one breath cycle in seconds
+        """
+        def effect(elapsed: float) -> Tuple[int, int, int]:
+            # Use sine wave for smooth breathing
+            scale = (math.sin(elapsed * 2 * math.pi / duration) + 1) / 2
+            return tuple(int(c * scale) for c in color)
+
+        return effect
+
+    @staticmethod
+    def color_cycle(scheme: str = 'sunset', duration: float = 5.0) -> ZoneEffect:
+        """
+        Create a zone effect that cycles through a color scheme
+
+        Args:
+            scheme: Name of the color scheme to use
+            duration: Time for one complete cycle in seconds
+        """
+        colors = ColorSchemes.get_scheme(scheme)
+        num_colors = len(colors)
+
+        def effect(elapsed: float) -> Tuple[int, int, int]:
+            pos = (elapsed / duration) % 1.0
+
+            idx1 = int(pos * num_colors)
+            idx2 = (idx1 + 1) % num_colors
+
+            local_pos = (pos * num_colors) % 1.0
+
+            # Interpolate between colors
+            return tuple(
+                int((c1 * (1 - local_pos) + c2 * local_pos) * 255)
+                for c1, c2 in zip(colors[idx1], colors[idx2])
+            )
+
+        return effect
+
+    @staticmethod
+    def rainbow(duration: float = 5.0, offset: float = 0.0) -> ZoneEffect:
+        """
+        Create a zone effect that cycles through the color wheel
+
+        Args:
+            duration: Time for one complete cycle in seconds
+            offset: Starting hue (0.0-1.0)
+        """
+        def effect(elapsed: float) -> Tuple[int, int, int]:
+            hue = (elapsed / duration + offset) % 1.0
+            return tuple(int(c * 255) for c in colorsys.hsv_to_rgb(hue, 1.0, 1.0))
+
+        return effect
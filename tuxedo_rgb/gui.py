@@ -10,6 +10,7 @@ from .controller import TuxedoController
 from .effects.basic import BasicEffects
 from .effects.rainbow import RainbowEffects
 from .effects.schemes import ColorSchemes
+from .effects.zones import ZoneEffects
 
 
 class TuxedoRGBWindow(Gtk.ApplicationWindow):
@@ -20,6 +21,7 @@ class TuxedoRGBWindow(Gtk.ApplicationWindow):
         self.controller = TuxedoController()
         self.basic_effects = BasicEffects(self.controller)
         self.rainbow_effects = RainbowEffects(self.controller)
+        self.zone_effects = ZoneEffects(self.controller)
 
         # Keep track of running effect thread
         self.effect_thread: Optional[threading.Thread] = None
@@ -66,7 +68,8 @@ class TuxedoRGBWindow(Gtk.ApplicationWindow):
             "Breathing",
             "Rainbow Static",
             "Rainbow Wave",
-            "Color Cycle"
+            "Color Cycle",
+            "Per Zone"
         ]
         for effect in self.effects:
             self.effects_combo.append_text(effect)
@@ -87,6 +90,32 @@ class TuxedoRGBWindow(Gtk.ApplicationWindow):
         scheme_section.append(self.scheme_combo)
         main_box.append(scheme_section)
 
+        # Per-zone section
+        self.zone_section = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
+        self.zone_section.append(Gtk.Label(label="Per-Zone Effects:", xalign=0))
+        self.zone_effect_names = ["Solid", "Breathing", "Color Cycle", "Rainbow"]
+        self.zone_combos = {}
+        self.zone_color_buttons = {}
+        for zone in self.controller.zones:
+            zone_row = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+            zone_label = Gtk.Label(label=f"{zone.capitalize()}:")
+            zone_label.set_size_request(60, -1)
+            zone_label.set_xalign(0)
+            zone_combo = Gtk.ComboBoxText()
+            for name in self.zone_effect_names:
+                zone_combo.append_text(name)
+            zone_combo.set_active(0)
+            zone_color_button = Gtk.ColorButton()
+            zone_color_button.set_rgba(Gdk.RGBA(1, 1, 1, 1))
+            zone_row.append(zone_label)
+            zone_row.append(zone_combo)
+            zone_row.append(zone_color_button)
+            self.zone_section.append(zone_row)
+            self.zone_combos[zone] = zone_combo
+            self.zone_color_buttons[zone] = zone_color_button
+        self.zone_section.set_sensitive(False)
+        main_box.append(self.zone_section)
+
         # Duration section
         duration_section = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
         duration_label = Gtk.Label(label="Effect Duration (seconds):")
@@ -126,12 +155,39 @@ class TuxedoRGBWindow(Gtk.ApplicationWindow):
         """Handle effect selection changes"""
         effect = self.effects[combo.get_active()]
         # Enable/disable relevant controls based on effect
-        uses_scheme = effect in ["Color Cycle"]
+        uses_scheme = effect in ["Color Cycle", "Per Zone"]
         self.scheme_combo.set_sensitive(uses_scheme)
 
-        uses_duration = effect in ["Breathing", "Rainbow Wave", "Color Cycle"]
+        uses_duration = effect in ["Breathing", "Rainbow Wave", "Color Cycle", "Per Zone"]
         self.duration_scale.set_sensitive(uses_duration)
 
+        self.zone_section.set_sensitive(effect == "Per Zone")
+
+    def build_zone_effects(self, duration):
+        """Assign the effect selected for each zone to the zone scheduler"""
+        scheme = self.scheme_combo.get_active_text()
+        self.zone_effects.clear()
+        for offset, zone in enumerate(self.zone_combos):
+            name = self.zone_effect_names[self.zone_combos[zone].get_active()]
+            rgba = self.zone_color_buttons[zone].get_rgba()
+            color = (
+                int(rgba.red * 255),
+                int(rgba.green * 255),
+                int(rgba.blue * 255)
+            )
+            if name == "Solid":
+                effect = ZoneEffects.solid(color)
+            elif name == "Breathing":
+                effect = ZoneEffects.breathing(color, duration=duration)
+            elif name == "Color Cycle":
+                effect = ZoneEffects.color_cycle(scheme=scheme, duration=duration)
+            else:
+                # Spread rainbow zones around the color wheel
+                effect = ZoneEffects.rainbow(
+                    duration=duration, offset=offset / len(self.zone_combos)
+                )
+            self.zone_effects.assign(zone, effect)
+
     def stop_current_effect(self):
         """Stop any running effect thread"""
         if self.effect_thread and self.effect_thread.is_alive():
@@ -211,6 +267,13 @@ class TuxedoRGBWindow(Gtk.ApplicationWindow):
                     args=(self.basic_effects.breathing,),
                     kwargs={'color': color, 'duration': duration}
                 )
+            elif effect == "Per Zone":
+                self.build_zone_effects(duration)
+                self.effect_thread = threading.Thread(
+                    target=self.run_effect,
+                    args=(self.zone_effects.run,),
+                    kwargs={'stop_event': self.stop_effect}
+                )
 
             self.effect_thread.start()
 